@@ -18,10 +18,30 @@ Author: ZyloX Studios (Reorganized and documented)
 
 # Standard library imports
 import os
+import re
 import sys
+import mmap
 import time
+import queue
+import atexit
+import threading
+import json
+import heapq
 import random
+import string
 import pickle
+import operator
+import itertools
+import functools
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+# Single-key console input (see read_key)
+if os.name == 'nt':
+    import msvcrt
+else:
+    import tty
+    import termios
 
 # Third-party imports
 import pygame
@@ -30,13 +50,73 @@ from termcolor import colored, cprint
 from pyfiglet import figlet_format
 
 
+# High scores are stored as JSON lines (one score entry per line) so that
+# saving a score is a single append; earlier versions used a pickle file
+HIGH_SCORES_FILE = "high_scores.jsonl"
+LEGACY_HIGH_SCORES_FILE = "high_scores.pkl"
+
+# Border drawn around the in-game display on every redraw
+GAME_STATE_BORDER = "═" * 70
+
+# Visible width of the hangman column in the in-game display
+HANGMAN_COLUMN_WIDTH = 40
+
+# Sort key for leaderboard entries (C-level itemgetter instead of a lambda)
+SCORE_KEY = operator.itemgetter("score")
+
+# Number of entries shown on the default (top players) leaderboard view
+LEADERBOARD_TOP_COUNT = 10
+
+# Bit for each letter in the guessed-letter masks used during a round
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(string.ascii_lowercase)}
+
+# A full-word guess: two or more letters a-z and nothing else
+WORD_GUESS_RE = re.compile(r'[a-z]{2,}')
+
+# ANSI escape sequence that clears the screen and moves the cursor home
+CLEAR_SCREEN_SEQ = "\x1b[2J\x1b[H"
+
+# Matches the ANSI color codes emitted by termcolor
+ANSI_COLOR_RE = re.compile(r'\x1b\[\d+m')
+
+# When output goes to a pipe or log file, animations, screen clearing and
+# colors are skipped since nobody is watching them
+STDOUT_IS_TTY = sys.stdout.isatty()
+
+# Static title art, rendered by pyfiglet once at import time
+STUDIO_TITLE_ART = figlet_format('    ZYLO_ X', font='starwars')
+STUDIO_SUBTITLE_ART = figlet_format('STUDIOS', font='slant')
+GAME_TITLE_ART = figlet_format("HANGMAN", font="doom")
+
+
+@functools.lru_cache(maxsize=32)
+def figlet_text(text, font):
+    """
+    Render text as figlet art, remembering the result.
+    
+    Screen titles are redrawn many times per session; pyfiglet only has to
+    lay each (text, font) pair out once.
+    
+    Args:
+        text (str): Text to render
+        font (str): Name of the pyfiglet font
+        
+    Returns:
+        str: The rendered ASCII art
+    """
+    return figlet_format(text, font=font)
+
+
 ###############################################################################
 # File Path and Resource Management Utilities
 ###############################################################################
 
+@functools.lru_cache(maxsize=1)
 def get_data_directory():
     """
     Get a platform-specific directory for storing game data files.
+    
+    The directory is resolved (and created if needed) only once per run.
     """
     if getattr(sys, 'frozen', False):
         # When frozen, keep data files next to the executable
@@ -56,11 +136,18 @@ def get_data_directory():
     
     return app_data_dir
 
+# Base folder for read-only resources: PyInstaller creates a temp folder
+# and stores its path in _MEIPASS, otherwise use the working directory
+RESOURCE_BASE_PATH = getattr(sys, '_MEIPASS', os.path.abspath("."))
+
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     Get absolute path to resource, works for development and PyInstaller.
     
     Handles file paths for read-only resources like word lists and sounds.
+    Results are cached, since the same few paths are requested repeatedly.
     
     Args:
         relative_path (str): Relative path to the resource
@@ -68,12 +155,6 @@ def resource_path(relative_path):
     Returns:
         str: Absolute path to the resource
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-        
     # Handle data directory paths for read-only files
     if not relative_path.startswith("data/") and (
         relative_path.endswith(".txt") or 
@@ -83,7 +164,7 @@ def resource_path(relative_path):
         # Automatically prepend "data/" if needed
         relative_path = os.path.join("data", relative_path)
     
-    return os.path.join(base_path, relative_path)
+    return os.path.join(RESOURCE_BASE_PATH, relative_path)
 
 
 def get_save_file_path(filename):
@@ -105,6 +186,49 @@ def get_save_file_path(filename):
     return os.path.join(data_dir, filename)
 
 
+###############################################################################
+# Console Input Utilities
+###############################################################################
+
+def read_key():
+    """
+    Read a single key press without waiting for Enter.
+    
+    Keys typed before the call are discarded, and multi-byte keys (arrows,
+    function keys) are read whole so nothing is left over for the next
+    read; only their first character is returned. The chosen key is echoed.
+    Falls back to reading a whole line when stdin is not a terminal
+    (e.g. piped input).
+    
+    Returns:
+        str: The key pressed, lowercased
+    """
+    if not sys.stdin.isatty():
+        return input("").strip().lower()
+    
+    if os.name == 'nt':
+        # Drop keys typed earlier (e.g. during an animation)
+        while msvcrt.kbhit():
+            msvcrt.getwch()
+        key = msvcrt.getwch()
+        if key in ("\x00", "\xe0"):
+            msvcrt.getwch()  # Special keys send a second code
+    else:
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            # cbreak mode delivers keys immediately but keeps Ctrl+C working
+            tty.setcbreak(fd)
+            termios.tcflush(fd, termios.TCIFLUSH)  # Drop keys typed earlier
+            # Read straight from the fd so a whole escape sequence is consumed
+            key = os.read(fd, 8).decode("utf-8", errors="ignore")[:1]
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    
+    print(key if key.isprintable() else "")
+    return key.lower()
+        
+
 ###############################################################################
 # Sound Management Class
 ###############################################################################
@@ -114,33 +238,43 @@ class SoundManager:
     Handles all game sounds using pygame mixer.
     
     Loads and plays sound effects for different game events like
-    correct/incorrect guesses, hints, wins, and game over.
+    correct/incorrect guesses, hints, wins, and game over. Each sound is
+    loaded from disk the first time it is played.
     """
     
+    # Volume level for all sound effects (0.0 to 1.0)
+    VOLUME = 0.7
+    
+    # Number of mixer channels reused in round-robin order
+    NUM_CHANNELS = 8
+    
     def __init__(self):
         """
-        Initialize the sound system and load sound effects.
+        Initialize the sound system and register the sound effect files.
         
         Handles errors gracefully if sound initialization fails.
         """
+        # Sound effect files with descriptive names, loaded on first play
+        self._sound_paths = {
+            "correct": resource_path("correct.ogg"),
+            "incorrect": resource_path("incorrect.wav"),
+            "hint": resource_path("hint.wav"),
+            "win": resource_path("win.ogg"),
+            "game_over": resource_path("gameover.ogg"),
+            "menu_select": resource_path("menu_select.ogg")
+        }
+        self.sounds = {}
+        self._channels = []
+        self._next_channel = 0
+        
         try:
             pygame.mixer.init()
             self.sound_enabled = True
             
-            # Load all sound effects with descriptive names
-            self.sounds = {
-                "correct": pygame.mixer.Sound(resource_path("correct.ogg")),
-                "incorrect": pygame.mixer.Sound(resource_path("incorrect.wav")),
-                "hint": pygame.mixer.Sound(resource_path("hint.wav")),
-                "win": pygame.mixer.Sound(resource_path("win.ogg")),
-                "game_over": pygame.mixer.Sound(resource_path("gameover.ogg")),
-                "menu_select": pygame.mixer.Sound(resource_path("menu_select.ogg"))
-            }
-            
-            # Set volume levels (0.0 to 1.0)
-            for sound in self.sounds.values():
-                sound.set_volume(0.7)
-            
+            # Reserve a fixed pool of channels instead of letting pygame
+            # search for a free one on every play
+            pygame.mixer.set_num_channels(self.NUM_CHANNELS)
+            self._channels = [pygame.mixer.Channel(i) for i in range(self.NUM_CHANNELS)]
         except Exception as e:
             print(f"Sound initialization failed: {e}")
             self.sound_enabled = False
@@ -156,11 +290,37 @@ class SoundManager:
             return
             
         try:
-            if sound_name in self.sounds:
-                self.sounds[sound_name].play()
+            sound = self.sounds.get(sound_name)
+            if sound is None and sound_name in self._sound_paths:
+                # Load and cache the sound the first time it is needed
+                sound = pygame.mixer.Sound(self._sound_paths[sound_name])
+                sound.set_volume(self.VOLUME)
+                self.sounds[sound_name] = sound
+            
+            if sound is not None:
+                self._play_on_channel(sound)
         except Exception as e:
             print(f"Error playing sound '{sound_name}': {e}")
     
+    def _play_on_channel(self, sound):
+        """
+        Play a sound on the next channel of the pool.
+        
+        Args:
+            sound (pygame.mixer.Sound): The loaded sound to play
+        """
+        if not self._channels:
+            sound.play()
+            return
+        
+        channel = self._channels[self._next_channel]
+        self._next_channel = (self._next_channel + 1) % len(self._channels)
+        try:
+            channel.play(sound)
+        except Exception:
+            # Fall back to letting pygame pick a channel
+            sound.play()
+    
     def stop_all(self):
         """
         Stop all currently playing sounds.
@@ -174,6 +334,26 @@ class SoundManager:
             pygame.mixer.stop()
         except Exception:
             pass
+    
+    def wait_until_idle(self, timeout):
+        """
+        Wait until no sound is playing, for at most timeout seconds.
+        
+        Lets a pause overlap with the tail of a sound effect instead of
+        adding to it. Returns right away when sound is disabled.
+        
+        Args:
+            timeout (float): Maximum time to wait in seconds
+        """
+        if not self.sound_enabled:
+            return
+        
+        deadline = time.monotonic() + timeout
+        try:
+            while pygame.mixer.get_busy() and time.monotonic() < deadline:
+                time.sleep(0.05)
+        except Exception:
+            pass
 
 
 ###############################################################################
@@ -241,6 +421,35 @@ class HangmanGame:
       |
 =========''']
 
+    # Every word list file shipped with the game
+    WORD_LIST_FILES = ("Easywords.txt", "Hardwords.txt", "Animals.txt",
+                       "Countries.txt", "Movies.txt", "Mixed.txt")
+
+    # Color of the hangman figure for each number of wrong guesses
+    DANGER_COLORS = ["white", "green", "green", "yellow", "yellow", "red", "red"]
+
+    # Outcome of each key on the end-of-game menu (any other key: main menu)
+    _END_MENU = {"1": "restart", "3": "quit"}
+
+    # Borders shared by the menu and leaderboard screens (colored at use)
+    _BORDER_60 = "═" * 60
+    _BORDER_75 = "═" * 75
+    _RULE_60 = "─" * 60
+    _MENU_BORDER = "=" * 60
+    _BOX_TOP = "┌" + "─" * 56 + "┐"
+    _BOX_BOTTOM = "└" + "─" * 56 + "┘"
+
+    # Leaderboard table frame, always drawn in white
+    _TABLE_TOP = colored("┌" + "─" * 5 + "┬" + "─" * 20 + "┬" + "─" * 12 + "┬" + "─" * 25 + "┐", "white")
+    _TABLE_HEADER = colored("│ RANK│ PLAYER NAME        │ SCORE      │ CATEGORY                │", "white", attrs=["bold"])
+    _TABLE_SEP = colored("├" + "─" * 5 + "┼" + "─" * 20 + "┼" + "─" * 12 + "┼" + "─" * 25 + "┤", "white")
+    _TABLE_BOTTOM = colored("└" + "─" * 5 + "┴" + "─" * 20 + "┴" + "─" * 12 + "┴" + "─" * 25 + "┘", "white")
+
+    # Leaderboard row color and rank label: gold, silver and bronze for the
+    # top 3, white with the plain rank number for everyone else
+    _RANK_STYLE = {1: ("yellow", " 1🥇"), 2: ("cyan", " 2🥈"), 3: ("red", " 3🥉")}
+    _DEFAULT_RANK_STYLE = ("white", None)
+
     #-------------------------------------------------------------------------
     # Initialization Methods
     #-------------------------------------------------------------------------
@@ -259,32 +468,123 @@ class HangmanGame:
         self.mode = "Unknown"
         self.first_time = True
         
+        # Name entered the last time a score was saved, offered as the default
+        self._last_name = None
+        
+        # Pause (in seconds) after feedback messages during a round
+        self._feedback_delay = 0.4
+        
+        # Per-round str.translate table mapping every still-hidden character
+        # of the word to "-" (rebuilt whenever a new word is chosen)
+        self._hide_table = {}
+        
+        # Location of the high scores file, resolved once
+        self._high_scores_path = get_save_file_path(HIGH_SCORES_FILE)
+        
+        # In-memory copy of the leaderboard, loaded on first access
+        self._scores_cache = None
+        
+        # Set when the scores file ends in a partial line, so the next append
+        # starts on a fresh line instead of being glued onto it
+        self._scores_need_newline = False
+        
+        # Best LEADERBOARD_TOP_COUNT entries per mode (key None: all modes),
+        # built from the cache on first use and updated as scores are saved
+        self._top_scores = None
+        
+        # Score entries waiting to be appended by the background writer
+        self._score_queue = queue.Queue()
+        threading.Thread(target=self._score_writer_loop, daemon=True).start()
+        atexit.register(self.flush_scores)
+        
+        # Enable ANSI escape processing in the Windows console (used by clear_screen)
+        if os.name == 'nt':
+            os.system('')
+        
+        # Pre-render every hangman stage in every danger color, already padded
+        # to the column width, so redraws only have to look the lines up
+        self._hangman_rendered = {
+            (stage, color): [colored(line, color) + " " * (HANGMAN_COLUMN_WIDTH - len(line))
+                             for line in pic.splitlines()]
+            for stage, pic in enumerate(self.HANGMANPICS)
+            for color in set(self.DANGER_COLORS)
+        }
+        
+        # Pre-render the alphabet panel tiles for each guess status
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+        self._letter_correct = {c: colored(f" {c.upper()} ", "green", attrs=["bold"]) for c in alphabet}
+        self._letter_wrong = {c: colored(f" {c.upper()} ", "red") for c in alphabet}
+        self._letter_untried = {c: colored(f" {c.upper()} ", "white", attrs=["dark"]) for c in alphabet}
+        
+        # Pre-render the word-progress tiles (hidden slot and revealed letters)
+        self._word_hidden_tile = colored("_ ", "white")
+        self._word_letter_tiles = {c: colored(f"{c}  ", "yellow", attrs=["bold"]) for c in alphabet}
+        
+        # Pre-render the fixed feedback messages printed during a round
+        self._msg = {
+            "no_hints": colored("No hints left!", "red"),
+            "all_revealed": colored("All letters are already revealed!", "yellow"),
+            "already_guessed": colored("You already guessed that letter. Try again!", "red"),
+            "incorrect": colored("Incorrect guess!", "red"),
+            "incorrect_word": colored("Incorrect word guess!", "red"),
+            "invalid": colored("Invalid input. Please guess a single letter, the full word, or type 'hint'.", "red"),
+            "score_saved": colored("Your score has been saved!", "green", attrs=["bold"]),
+            "bonus": colored("You got +50 Bonus 🎁", "light_yellow"),
+        }
+        
+        # The end-of-game menu, joined into one string so it prints in one write
+        self._end_menu_screen = "\n".join([
+            colored("1- Start new game ", "green", attrs=["bold"]),
+            colored("2- Main-Menu", "yellow", attrs=["bold"]),
+            colored("3- Exit ", "red", attrs=["bold"]),
+            colored("=================================", "white", attrs=["bold"]),
+        ])
+        
+        # The main menu never changes, so render it once
+        self._rules_screen = self.render_game_rules()
+        
         # Try to optimize display for better experience
         self.attempt_fullscreen()
         
-        # Load word lists for different difficulty levels
-        self.easy_words = self.load_word_list("Easywords.txt")
-        self.hard_words = self.load_word_list("Hardwords.txt")
+        # Load all word lists (difficulty levels and custom categories) up front,
+        # reading the files concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {name: executor.submit(self.load_word_list, name) for name in self.WORD_LIST_FILES}
+            self.word_lists = {name: future.result() for name, future in futures.items()}
+        self.easy_words = self.word_lists["Easywords.txt"]
+        self.hard_words = self.word_lists["Hardwords.txt"]
+        
+        # Total letters per word list file, counted once while the lists are
+        # fresh so average word lengths never walk the words again
+        self._letter_counts = {name: sum(map(len, words)) for name, words in self.word_lists.items()}
 
         # Initialize sound system
         self.sound_manager = SoundManager()
     
     def attempt_fullscreen(self):
         """
-        Set the terminal to exclusive fullscreen mode using the keyboard library.
+        Maximize the terminal window for a better gaming experience.
         
-        Simulates pressing F11 to trigger fullscreen mode for a better gaming experience.
-        Falls back gracefully if the operation fails.
+        Uses the Win32 API on Windows and the xterm window-manipulation escape
+        sequence elsewhere (ignored by terminals that don't support it).
+        Skipped when output is not a terminal. Falls back gracefully if the
+        operation fails.
         """
+        if not STDOUT_IS_TTY:
+            return
+        
         try:
-            import keyboard
-            keyboard.press('f11')
-            # Brief pause to allow the fullscreen transition to complete
-            import time
-            time.sleep(0.5)
+            if os.name == 'nt':
+                import ctypes
+                console_window = ctypes.windll.kernel32.GetConsoleWindow()
+                if console_window:
+                    ctypes.windll.user32.ShowWindow(console_window, 3)  # SW_MAXIMIZE
+            else:
+                sys.stdout.write("\x1b[9;1t")
+                sys.stdout.flush()
             self.clear_screen()  # Clear screen to utilize the new display area
-        except Exception as e:
-            # Fallback if keyboard library fails
+        except Exception:
+            # Fallback if the window can't be resized
             print("For the best experience, press F11 to enter fullscreen mode.")
             time.sleep(2)
     
@@ -300,70 +600,101 @@ class HangmanGame:
             filename (str): Name of the word list file
             
         Returns:
-            list: List of words loaded from the file, or default words if file not found
+            tuple: Words loaded from the file, or default words if file not found
         """
         try:
             full_path = resource_path(filename)
             
-            with open(full_path, 'r') as file:
-                words = [line.strip().lower() for line in file if line.strip()]
+            with open(full_path, 'rb') as file:
+                try:
+                    # Map the file into memory and split it in one pass
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        lines = mm[:].split(b'\n')
+                except ValueError:
+                    # Empty files (or files that can't be mapped) are read normally
+                    lines = file.read().split(b'\n')
+            
+            words = [line.strip().decode('utf-8').lower() for line in lines if line.strip()]
                 
-            return words
+            # Word lists are read-only, so store them as tuples of interned strings
+            return tuple(sys.intern(word) for word in words)
         except FileNotFoundError:
             # Provide default words for each category
             print(f"Warning: {filename} not found. Using default words.")
             if filename == "Easywords.txt":
-                return ["python", "hangman", "game", "computer", "programming", 
-                        "simple", "basic", "easy", "word", "guess"]
+                return ("python", "hangman", "game", "computer", "programming", 
+                        "simple", "basic", "easy", "word", "guess")
             elif filename == "Hardwords.txt":
-                return ["xylophone", "jazz", "pneumonia", "oxygen", "acquisition",
-                       "cryptography", "philosophy", "psychology", "rhythm", "syndrome"]
+                return ("xylophone", "jazz", "pneumonia", "oxygen", "acquisition",
+                       "cryptography", "philosophy", "psychology", "rhythm", "syndrome")
             elif filename == "Animals.txt":
-                return ["dog", "cat", "elephant", "tiger", "zebra", "lion", "giraffe", "monkey"]
+                return ("dog", "cat", "elephant", "tiger", "zebra", "lion", "giraffe", "monkey")
             elif filename == "Countries.txt":
-                return ["france", "germany", "italy", "japan", "brazil", "canada", "india"]
+                return ("france", "germany", "italy", "japan", "brazil", "canada", "india")
             elif filename == "Movies.txt":
-                return ["avatar", "titanic", "jaws", "alien", "matrix", "frozen"]
+                return ("avatar", "titanic", "jaws", "alien", "matrix", "frozen")
             elif filename == "Mixed.txt":
-                return ["apple", "house", "river", "music", "window", "doctor", "summer"]
+                return ("apple", "house", "river", "music", "window", "doctor", "summer")
             else:
-                return ["hangman", "python", "game", "words", "guess"]
+                return ("hangman", "python", "game", "words", "guess")
     
-    def load_scores_pickle(self):
+    def load_scores(self):
         """
-        Load scores from pickle file in user data directory.
+        Load scores from the JSON lines file in user data directory.
         
-        Creates a new file if none exists.
+        The file is only read once per session; later calls return the
+        in-memory copy kept up to date by the save and clear methods.
+        Creates a new file if none exists. A line cut short by an
+        interrupted write is skipped instead of discarding the whole file,
+        and the next save starts on a new line after it.
         
         Returns:
             list: List of score entries with player name, score, and mode
         """
+        if self._scores_cache is not None:
+            return self._scores_cache
+        
         try:
             # Get the proper path for the high scores file
-            save_path = get_save_file_path("high_scores.pkl")
+            save_path = self._high_scores_path
         
             # Log the path being used
             print(f"Loading scores from: {save_path}")
         
-            # Load the scores
-            with open(save_path, "rb") as file:
-                return pickle.load(file)
-        except (FileNotFoundError, EOFError):
+            # Load the scores, one entry per line
+            scores = []
+            line = ""
+            with open(save_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    try:
+                        scores.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        print("Skipping an unreadable line in the scores file.")
+            self._scores_need_newline = bool(line) and not line.endswith("\n")
+            self._scores_cache = scores
+        except FileNotFoundError:
             print("No existing scores file found. Creating a new one.")
-            # Create an empty file
-            self.save_score_pickle("DefaultPlayer", 0)
-            return []  # Return an empty list if the file doesn't exist or is corrupt
+            # Start from an empty list and create an empty file
+            self._scores_cache = []
+            open(save_path, "w").close()
+        
+        return self._scores_cache
     
-    def save_score_pickle(self, player_name, player_score):
+    def save_score(self, player_name, player_score):
         """
-        Save score to the pickle file with category information.
+        Save score to the high scores file with category information.
+        
+        The entry is added to the in-memory leaderboard right away and
+        appended to the file as a single line by the background writer.
         
         Args:
             player_name (str): Name of the player
             player_score (int): Score to save
         """
-        # Load existing scores
-        scores = self.load_scores_pickle()
+        # Load existing scores (served from memory after the first load)
+        scores = self.load_scores()
 
         # Create the score entry with more detailed mode info
         score_entry = {
@@ -373,20 +704,123 @@ class HangmanGame:
         }
 
         scores.append(score_entry)
+        self._add_top_score(score_entry)
 
         # Get the proper save path
-        save_path = get_save_file_path("high_scores.pkl")
+        save_path = self._high_scores_path
     
         # Log the save operation
         print(f"Saving score for {player_name} ({player_score} points) to: {save_path}")
     
+        # Hand the new score to the background writer
+        self._score_queue.put(score_entry)
+    
+    def top_scores(self, modes=None):
+        """
+        Return the best leaderboard entries, highest score first.
+        
+        Served from a per-mode index, so the top players view never has
+        to sort the whole leaderboard.
+        
+        Args:
+            modes (set, optional): Only consider entries of these game modes
+        
+        Returns:
+            list: Up to LEADERBOARD_TOP_COUNT score entries
+        """
+        if self._top_scores is None:
+            by_mode = collections.defaultdict(list)
+            scores = self.load_scores()
+            for entry in scores:
+                by_mode[entry["mode"]].append(entry)
+            self._top_scores = {mode: heapq.nlargest(LEADERBOARD_TOP_COUNT, entries, key=SCORE_KEY)
+                                for mode, entries in by_mode.items()}
+            self._top_scores[None] = heapq.nlargest(LEADERBOARD_TOP_COUNT, scores, key=SCORE_KEY)
+        
+        if modes is None:
+            return list(self._top_scores[None])
+        if len(modes) == 1:
+            (mode,) = modes
+            return list(self._top_scores.get(mode, ()))
+        candidates = itertools.chain.from_iterable(self._top_scores.get(mode, ()) for mode in modes)
+        return heapq.nlargest(LEADERBOARD_TOP_COUNT, candidates, key=SCORE_KEY)
+    
+    def _add_top_score(self, score_entry):
+        """
+        Insert a newly saved score into the top scores index, if it is built.
+        
+        Args:
+            score_entry (dict): The saved score entry
+        """
+        if self._top_scores is None:
+            return
+        
+        for key in (score_entry["mode"], None):
+            top = self._top_scores.setdefault(key, [])
+            if len(top) < LEADERBOARD_TOP_COUNT or score_entry["score"] > top[-1]["score"]:
+                # Stable sort keeps older entries ahead of the new one on ties
+                top.append(score_entry)
+                top.sort(key=SCORE_KEY, reverse=True)
+                del top[LEADERBOARD_TOP_COUNT:]
+    
+    def _score_writer_loop(self):
+        """
+        Append queued score entries to the high scores file.
+        
+        Runs on a background thread for the lifetime of the game. Entries
+        that pile up while a write is in progress are written together.
+        """
+        while True:
+            entries = [self._score_queue.get()]
+            while True:
+                try:
+                    entries.append(self._score_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                with open(self._high_scores_path, "a", encoding="utf-8") as file:
+                    if self._scores_need_newline:
+                        file.write("\n")  # Finish the partial last line first
+                        self._scores_need_newline = False
+                    file.writelines(json.dumps(entry) + "\n" for entry in entries)
+            except Exception as e:
+                print(f"Error saving score: {e}")
+            finally:
+                for _ in entries:
+                    self._score_queue.task_done()
+    
+    def flush_scores(self):
+        """
+        Block until every queued score has been written to disk.
+        
+        Registered with atexit so no score is lost when the game exits.
+        """
+        self._score_queue.join()
+    
+    def migrate_legacy_scores(self):
+        """
+        Convert a high scores file from the old pickle format, if there is one.
+        
+        Only runs when no JSON lines file exists yet; the old file is left
+        in place untouched.
+        """
+        save_path = self._high_scores_path
+        legacy_path = get_save_file_path(LEGACY_HIGH_SCORES_FILE)
+        if os.path.isfile(save_path) or not os.path.isfile(legacy_path):
+            return
+        
         try:
-            # Save the scores
-            with open(save_path, "wb") as file:
-                pickle.dump(scores, file)
-            print("Score saved successfully!")
+            with open(legacy_path, "rb") as file:
+                scores = pickle.load(file)
+            with open(save_path, "w", encoding="utf-8") as file:
+                file.writelines(json.dumps(entry) + "\n" for entry in scores)
+            print(f"Migrated {len(scores)} scores to: {save_path}")
+            
+            # The new file holds exactly these scores, so skip reading it back
+            self._scores_cache = list(scores)
         except Exception as e:
-            print(f"Error saving score: {e}")
+            print(f"Error migrating old scores file: {e}")
     
     def clear_leaderboard(self):
         """
@@ -394,20 +828,23 @@ class HangmanGame:
         
         Completely resets the high scores file after confirmation.
         """
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.clear_screen()
         cprint("⚠️ WARNING: This will reset the leaderboard and delete all scores!", "red", attrs=["bold"])
         confirm = input("Are you sure you want to clear the leaderboard? (yes/no): ").strip().lower()
         if confirm == "yes":
             # Get the proper save path
-            save_path = get_save_file_path("high_scores.pkl")
+            save_path = self._high_scores_path
         
-            with open(save_path, "wb") as file:
-                pickle.dump([], file)  # Overwrite with an empty list
+            self.flush_scores()  # Don't let a pending write land after the reset
+            self._scores_cache = []
+            self._top_scores = None
+            self._scores_need_newline = False
+            open(save_path, "w").close()  # Truncate to an empty file
             cprint("Leaderboard has been cleared successfully!", "green", attrs=["bold"])
         else:
             cprint("Leaderboard reset canceled.", "yellow", attrs=["bold"])
         input("Press Enter to return to the main menu...")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.clear_screen()
     
     #-------------------------------------------------------------------------
     # Sound Effect Methods
@@ -442,8 +879,32 @@ class HangmanGame:
     #-------------------------------------------------------------------------
     
     def clear_screen(self):
-        """Clear the console screen in a cross-platform way."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """
+        Clear the console screen in a cross-platform way.
+        
+        Writes an ANSI escape sequence rather than spawning 'cls'/'clear'
+        (Windows consoles have ANSI processing enabled in __init__).
+        Does nothing when stdout is not a terminal.
+        """
+        if not STDOUT_IS_TTY:
+            return
+        sys.stdout.write(CLEAR_SCREEN_SEQ)
+        sys.stdout.flush()
+    
+    def write_lines(self, lines):
+        """
+        Write a batch of pre-rendered lines to the terminal with a single write.
+        
+        Color codes are stripped when stdout is not a terminal.
+        
+        Args:
+            lines (list): Lines of text (may include color codes), without newlines
+        """
+        text = "\n".join(lines) + "\n"
+        if not STDOUT_IS_TTY:
+            text = self.strip_color_codes(text)
+        sys.stdout.write(text)
+        sys.stdout.flush()
     
     def loading_screen(self):
         """
@@ -452,8 +913,8 @@ class HangmanGame:
         Creates a visual introduction to the game with animated effects.
         """
         print("\n" * 6)
-        cprint(figlet_format('    ZYLO_ X', font='starwars'), 'white', 'on_black', attrs=['blink'])
-        cprint(figlet_format('STUDIOS', font='slant'), 'light_green', 'on_black', attrs=['blink'])
+        cprint(STUDIO_TITLE_ART, 'white', 'on_black', attrs=['blink'])
+        cprint(STUDIO_SUBTITLE_ART, 'light_green', 'on_black', attrs=['blink'])
         print()
         time.sleep(1.5)
         self.clear_screen()
@@ -505,20 +966,20 @@ class HangmanGame:
         Returns:
             str: Text without color codes
         """
-        import re
-        return re.sub(r'\x1b\[\d+m', '', text)
+        return ANSI_COLOR_RE.sub('', text)
     
-    def display_game_state(self, hidden_word, attempts_left, guessed_letters, wrong_guesses):
+    def display_game_state(self, hidden_word, attempts_left, guessed_mask, wrong_guesses):
         """
         Display current game state with enhanced visuals.
         
         Shows the hangman figure, word progress, guessed letters, and game statistics
-        in a visually appealing format with appropriate colors.
+        in a visually appealing format with appropriate colors. The whole frame is
+        built up first and written to the terminal in one go.
         
         Args:
             hidden_word (str): Current state of the word with some letters hidden
             attempts_left (int): Number of remaining incorrect guesses allowed
-            guessed_letters (set): Set of letters that have been guessed
+            guessed_mask (int): Bitmask of the letters that have been guessed (see LETTER_BITS)
             wrong_guesses (int): Count of incorrect guesses
         """
         self.clear_screen()
@@ -533,29 +994,25 @@ class HangmanGame:
         else:
             border_color = "yellow"
             mode_display = "🟡 Custom-Game"       
-        border = "═" * 70
+        border = GAME_STATE_BORDER
         
         # Game header with level and difficulty information
-        cprint(border, border_color)
-        cprint(f"  LEVEL: {self.level+1}  |  {mode_display}  |  HINTS: {self.hints}", border_color, attrs=["bold"])
-        cprint(border, border_color)
+        lines = [
+            colored(border, border_color),
+            colored(f"  LEVEL: {self.level+1}  |  {mode_display}  |  HINTS: {self.hints}", border_color, attrs=["bold"]),
+            colored(border, border_color),
+        ]
         
         # Create two-column layout for better space usage
-        left_column = []
         right_column = []
         
-        # Add hangman ASCII art to left column with appropriate coloring
-        hangman_lines = self.HANGMANPICS[wrong_guesses].splitlines()
-        danger_level = ["white", "green", "green", "yellow", "yellow", "red", "red"]
-        hangman_color = danger_level[wrong_guesses] if wrong_guesses < len(danger_level) else "red"
-        
-        # Format hangman with color based on danger level
-        for line in hangman_lines:
-            left_column.append(colored(line, hangman_color))
+        # Add pre-rendered hangman ASCII art to left column, colored by danger level
+        hangman_color = self.DANGER_COLORS[wrong_guesses] if wrong_guesses < len(self.DANGER_COLORS) else "red"
+        left_column = list(self._hangman_rendered[(wrong_guesses, hangman_color)])
         
         # Fill in remaining lines to align with right column
         while len(left_column) < 8:
-            left_column.append("")
+            left_column.append(" " * HANGMAN_COLUMN_WIDTH)
         
         # Create scoreboard for right column
         right_column.append(colored("📊 GAME STATS:", "cyan", attrs=["bold"]))
@@ -567,129 +1024,151 @@ class HangmanGame:
         right_column.append(colored("└─────────────────────────────┘", "white"))
         
         # Display the two columns side by side
+        # (left column lines are already padded to HANGMAN_COLUMN_WIDTH)
         for idx in range(max(len(left_column), len(right_column))):
-            left = left_column[idx] if idx < len(left_column) else ""
+            left = left_column[idx] if idx < len(left_column) else " " * HANGMAN_COLUMN_WIDTH
             right = right_column[idx] if idx < len(right_column) else ""
-            
-            # Calculate padding to align columns
-            padding = " " * (40 - len(self.strip_color_codes(left)))
-            print(f"{left}{padding}{right}")
+            lines.append(f"{left}{right}")
         
         # Display word progress with letter spacing and visual enhancement
-        cprint("\n WORD TO GUESS:", "cyan", attrs=["bold"])
+        lines.append("")
+        lines.append(colored(" WORD TO GUESS:", "cyan", attrs=["bold"]))
         
         # Format the hidden word with spacing and highlighting
-        formatted_word = ""
-        for letter in hidden_word:
-            if letter == "-":
-                formatted_word += colored("_ ", "white")
-            else:
-                formatted_word += colored(f"{letter}  ", "yellow", attrs=["bold"])
+        formatted_word = "".join(
+            self._word_hidden_tile if letter == "-"
+            else self._word_letter_tiles.get(letter) or colored(f"{letter}  ", "yellow", attrs=["bold"])
+            for letter in hidden_word
+        )
         
-        cprint(f"  {formatted_word}", "white")
+        lines.append(colored(f"  {formatted_word}", "white"))
         
         # Display guessed letters in a visually appealing way
-        cprint("\n LETTERS TRIED:", "cyan", attrs=["bold"])
+        lines.append("")
+        lines.append(colored(" LETTERS TRIED:", "cyan", attrs=["bold"]))
         
         alphabet = "abcdefghijklmnopqrstuvwxyz"
+        revealed_letters = set(hidden_word)  # O(1) lookups in the loop below
+        letters_row = ""
         for idx, letter in enumerate(alphabet):
             # Create a new line every 9 letters for better formatting
             if idx % 9 == 0 and idx > 0:
-                print()
+                lines.append(letters_row)
+                letters_row = ""
                 
-            # Color and format based on guess status
-            if letter in guessed_letters:
-                if letter in hidden_word:
-                    print(colored(f" {letter.upper()} ", "green", attrs=["bold"]), end="")
+            # Pick the pre-rendered tile based on guess status
+            if guessed_mask & LETTER_BITS[letter]:
+                if letter in revealed_letters:
+                    letters_row += self._letter_correct[letter]
                 else:
-                    print(colored(f" {letter.upper()} ", "red"), end="")
+                    letters_row += self._letter_wrong[letter]
             else:
-                print(colored(f" {letter.upper()} ", "white", attrs=["dark"]), end="")
+                letters_row += self._letter_untried[letter]
+        lines.append(letters_row)
         
         # Game hints and instructions at the bottom
-        cprint("\n\n" + border, border_color)
-        cprint(" Guess a letter, type the full word, or use 'hint' for help", "white")
-        cprint(" Type 'stp' to stop the game at any time", "yellow", attrs=["dark"])
-        cprint(border, border_color)
-        print()
+        lines.append("")
+        lines.append(colored(border, border_color))
+        lines.append(colored(" Guess a letter, type the full word, or use 'hint' for help", "white"))
+        lines.append(colored(" Type 'stp' to stop the game at any time", "yellow", attrs=["dark"]))
+        lines.append(colored(border, border_color))
+        lines.append("")
+        
+        self.write_lines(lines)
+    
+    def render_game_rules(self):
+        """
+        Build the main menu screen with game rules and options.
+        
+        The screen never changes, so it is rendered once in __init__ and
+        reused by display_game_rules.
+        
+        Returns:
+            str: The complete colored menu screen, ready to be written
+        """
+        lines = []
+        
+        # Title Section with decorative border
+        border = "=" * 70
+        lines.append(colored(border, "cyan"))
+        lines.append(colored(GAME_TITLE_ART, "red", attrs=["blink"]))
+        lines.append(colored(border, "cyan"))
+        
+        # Welcome message with icon
+        lines.append(colored("\n🎮  Welcome to the Ultimate Hangman Challenge! 🎮", "cyan", attrs=["bold"]))
+        
+        # Game description
+        lines.append(colored("\nTest your vocabulary and deduction skills in this classic word-guessing game.", "white"))
+        lines.append(colored("Can you save the hangman before it's too late?", "white"))
+        
+        # Rules Section
+        lines.append(colored("\n📋 GAME RULES:", "yellow", attrs=["bold"]))
+        lines.append(colored(self._RULE_60, "yellow"))
+        
+        # Core gameplay rules
+        rules = [
+            "🎯 A random word will be chosen based on your selected difficulty.",
+            "🔤 Guess one letter at a time or try to solve the whole word.",
+            "❌ Each incorrect guess adds a piece to the hangman figure.",
+            "⏱️ Complete the word before the hangman is fully drawn!",
+            "💡 Use 'hint' to reveal a letter (limited hints available)."
+        ]
+        
+        for rule in rules:
+            lines.append(colored(f"  {rule}", "white"))
+        
+        # Scoring System
+        lines.append(colored("\n🏆 SCORING SYSTEM:", "green", attrs=["bold"]))
+        lines.append(colored(self._RULE_60, "green"))
+        
+        scores = [
+            "✅ +10 points for each correct letter guessed",
+            "❌ -5 points for each incorrect guess (minimum score is 0)",
+            "🌟 +20 points bonus for guessing the entire word correctly",
+            "🎁 +1 hint for completing a word (accumulates for future games)"
+        ]
+        
+        for score in scores:
+            lines.append(colored(f"  {score}", "white"))
+        
+        # Difficulty Levels
+        lines.append(colored("\n🔥 DIFFICULTY LEVELS:", "magenta", attrs=["bold"]))
+        lines.append(colored(self._RULE_60, "magenta"))
+        
+        difficulties = [
+            "🟢 Normal: Common, everyday words",
+            "🔴 Hard: More challenging, uncommon words",
+            "🟡 Custom: Choose your category"
+        ]
+        
+        for diff in difficulties:
+            lines.append(colored(f"  {diff}", "white"))
+        
+        # Menu Options
+        lines.append(colored("\n⚙️ OPTIONS:", "blue", attrs=["bold"]))
+        lines.append(colored(self._RULE_60, "blue"))
+        
+        lines.append(colored("  1. 🎮 Start Game", "green"))
+        lines.append(colored("  2. 🏆 View Leaderboard", "cyan"))
+        lines.append(colored("  3. 🗑️ Clear Leaderboard", "red"))
+        lines.append(colored("  4. ❓ How to Play (Extra Tips)", "yellow"))
+        lines.append(colored("  5. 👋🏻 Exit Game", "white"))
+        
+        lines.append(colored("\n" + border, "cyan"))
+        return "\n".join(lines) + "\n"
     
     def display_game_rules(self):
         """
         Display game rules with enhanced visual elements.
         
-        Shows comprehensive game information, scoring system, and menu options.
+        Shows comprehensive game information, scoring system, and menu options
+        (pre-rendered once and written to the terminal in a single write).
         Handles user navigation through the menu system.
         """
         while True:
             self.clear_screen()
-            
-            # Title Section with decorative border
-            border = "=" * 70
-            cprint(border, "cyan")
-            cprint(figlet_format("HANGMAN", font="doom"), "red", attrs=["blink"])
-            cprint(border, "cyan")
-            
-            # Welcome message with icon
-            cprint("\n🎮  Welcome to the Ultimate Hangman Challenge! 🎮", "cyan", attrs=["bold"])
-            
-            # Game description
-            cprint("\nTest your vocabulary and deduction skills in this classic word-guessing game.", "white")
-            cprint("Can you save the hangman before it's too late?", "white")
-            
-            # Rules Section
-            cprint("\n📋 GAME RULES:", "yellow", attrs=["bold"])
-            cprint("─" * 60, "yellow")
-            
-            # Core gameplay rules
-            rules = [
-                "🎯 A random word will be chosen based on your selected difficulty.",
-                "🔤 Guess one letter at a time or try to solve the whole word.",
-                "❌ Each incorrect guess adds a piece to the hangman figure.",
-                "⏱️ Complete the word before the hangman is fully drawn!",
-                "💡 Use 'hint' to reveal a letter (limited hints available)."
-            ]
-            
-            for rule in rules:
-                cprint(f"  {rule}", "white")
-            
-            # Scoring System
-            cprint("\n🏆 SCORING SYSTEM:", "green", attrs=["bold"])
-            cprint("─" * 60, "green")
-            
-            scores = [
-                "✅ +10 points for each correct letter guessed",
-                "❌ -5 points for each incorrect guess (minimum score is 0)",
-                "🌟 +20 points bonus for guessing the entire word correctly",
-                "🎁 +1 hint for completing a word (accumulates for future games)"
-            ]
-            
-            for score in scores:
-                cprint(f"  {score}", "white")
-            
-            # Difficulty Levels
-            cprint("\n🔥 DIFFICULTY LEVELS:", "magenta", attrs=["bold"])
-            cprint("─" * 60, "magenta")
-            
-            difficulties = [
-                "🟢 Normal: Common, everyday words",
-                "🔴 Hard: More challenging, uncommon words",
-                "🟡 Custom: Choose your category"
-            ]
-            
-            for diff in difficulties:
-                cprint(f"  {diff}", "white")
-            
-            # Menu Options
-            cprint("\n⚙️ OPTIONS:", "blue", attrs=["bold"])
-            cprint("─" * 60, "blue")
-            
-            cprint("  1. 🎮 Start Game", "green")
-            cprint("  2. 🏆 View Leaderboard", "cyan")
-            cprint("  3. 🗑️ Clear Leaderboard", "red")
-            cprint("  4. ❓ How to Play (Extra Tips)", "yellow")
-            cprint("  5. 👋🏻 Exit Game", "white")
-            
-            cprint("\n" + border, "cyan")
+            sys.stdout.write(self._rules_screen)
+            sys.stdout.flush()
             
             # User input section with error handling
             try:
@@ -735,41 +1214,43 @@ class HangmanGame:
         and hint usage to help players improve their skills.
         """
         self.clear_screen()
+        lines = []
         
         # Title with decorative elements
-        cprint("🔍 HANGMAN STRATEGIES & TIPS 🔍", "cyan", attrs=["bold", "underline"])
-        print("")
+        lines.append(colored("🔍 HANGMAN STRATEGIES & TIPS 🔍", "cyan", attrs=["bold", "underline"]))
+        lines.append("")
         
         # Strategy sections
-        cprint("📊 LETTER FREQUENCY STRATEGY:", "yellow", attrs=["bold"])
-        cprint("─" * 60, "yellow")
-        cprint("  Start with common vowels: E, A, O, I, U", "white")
-        cprint("  Then try common consonants: T, N, S, R, H, L, D", "white")
-        cprint("  Save rare letters (J, Q, X, Z) for last attempts", "white")
-        
-        print("")
-        cprint("🧩 WORD PATTERN RECOGNITION:", "green", attrs=["bold"])
-        cprint("─" * 60, "green")
-        cprint("  Look for common prefixes (RE-, UN-, IN-) and suffixes (-ING, -ED, -LY)", "white")
-        cprint("  Double letters are common (LL, EE, SS, OO)", "white")
-        cprint("  Consonant clusters to watch for: TH, CH, SH, ST, PL", "white")
-        
-        print("")
-        cprint("⚡ HINT USAGE STRATEGY:", "magenta", attrs=["bold"])
-        cprint("─" * 60, "magenta")
-        cprint("  Save hints for critical moments when you're truly stuck", "white")
-        cprint("  Use hints to reveal positions of uncommon letters", "white")
-        cprint("  Don't use hints too early - try common letters first", "white")
-        
-        print("")
-        cprint("💭 WORD CATEGORIES TO CONSIDER:", "blue", attrs=["bold"])
-        cprint("─" * 60, "blue")
-        cprint("  Animals, countries, food, sports, hobbies", "white")
-        cprint("  Common phrases and expressions", "white")
-        cprint("  Seasonal or holiday-related words", "white")
-        
-        print("")
-        cprint("Press Enter to return to the main menu...", "cyan")
+        lines.append(colored("📊 LETTER FREQUENCY STRATEGY:", "yellow", attrs=["bold"]))
+        lines.append(colored(self._RULE_60, "yellow"))
+        lines.append(colored("  Start with common vowels: E, A, O, I, U", "white"))
+        lines.append(colored("  Then try common consonants: T, N, S, R, H, L, D", "white"))
+        lines.append(colored("  Save rare letters (J, Q, X, Z) for last attempts", "white"))
+        
+        lines.append("")
+        lines.append(colored("🧩 WORD PATTERN RECOGNITION:", "green", attrs=["bold"]))
+        lines.append(colored(self._RULE_60, "green"))
+        lines.append(colored("  Look for common prefixes (RE-, UN-, IN-) and suffixes (-ING, -ED, -LY)", "white"))
+        lines.append(colored("  Double letters are common (LL, EE, SS, OO)", "white"))
+        lines.append(colored("  Consonant clusters to watch for: TH, CH, SH, ST, PL", "white"))
+        
+        lines.append("")
+        lines.append(colored("⚡ HINT USAGE STRATEGY:", "magenta", attrs=["bold"]))
+        lines.append(colored(self._RULE_60, "magenta"))
+        lines.append(colored("  Save hints for critical moments when you're truly stuck", "white"))
+        lines.append(colored("  Use hints to reveal positions of uncommon letters", "white"))
+        lines.append(colored("  Don't use hints too early - try common letters first", "white"))
+        
+        lines.append("")
+        lines.append(colored("💭 WORD CATEGORIES TO CONSIDER:", "blue", attrs=["bold"]))
+        lines.append(colored(self._RULE_60, "blue"))
+        lines.append(colored("  Animals, countries, food, sports, hobbies", "white"))
+        lines.append(colored("  Common phrases and expressions", "white"))
+        lines.append(colored("  Seasonal or holiday-related words", "white"))
+        
+        lines.append("")
+        lines.append(colored("Press Enter to return to the main menu...", "cyan"))
+        self.write_lines(lines)
         input()
     
     def display_leaderboard(self, filter_mode=None, show_all=False):
@@ -777,304 +1258,293 @@ class HangmanGame:
         Display an enhanced leaderboard with filtering options.
         
         Shows player scores with rankings, supports filtering by game mode,
-        and displays game statistics.
+        and displays game statistics. Filter and view toggles redraw the
+        board in place until the player returns to the main menu.
         
         Args:
             filter_mode (str, optional): Mode to filter scores by
             show_all (bool, optional): Whether to show all scores or just top 10
         """
-        self.clear_screen()
-    
-        # Title and decorative elements
-        if filter_mode:
-            if filter_mode.startswith("Custom:"):
-                category = filter_mode.split(":")[1]
-                cprint(figlet_format(f"{category}", font="small"), "cyan", attrs=["bold"])
-            elif filter_mode == "Normal":
-                cprint(figlet_format("Normal MODE", font="small"), "green", attrs=["bold"])
-            else:
-                cprint(figlet_format("HARD MODE", font="small"), "red", attrs=["bold"])
-        else:
-            cprint(figlet_format("HALL OF FAME", font="small"), "cyan", attrs=["bold"])
-    
-        # Load all scores from the pickle file
-        scores = self.load_scores_pickle()
-    
-        # Initialize sorted_scores as an empty list by default
-        sorted_scores = []
+        while True:
+            self.clear_screen()
+            
+            # The whole screen is collected here and written in one go
+            lines = []
     
-        if not scores:
-            # No scores available
-            cprint("\n" + "═" * 60, "yellow")
-            cprint("📜 LEADERBOARD EMPTY 📜", "yellow", attrs=["bold", "blink"])
-            cprint("═" * 60, "yellow")
-            cprint("\nNo champion has claimed their place in history yet!", "white")
-            cprint("Be the first to set a high score and immortalize your name!", "white")
-        else:
-            # Filter scores if a mode is specified
+            # Title and decorative elements (figlet art only on a terminal)
             if filter_mode:
-                # For custom categories, we need partial matching
                 if filter_mode.startswith("Custom:"):
-                    filtered_scores = [s for s in scores if s["mode"].startswith(filter_mode)]
+                    title, title_color = filter_mode.split(":")[1], "cyan"
+                elif filter_mode == "Normal":
+                    title, title_color = "Normal MODE", "green"
                 else:
-                    filtered_scores = [s for s in scores if s["mode"] == filter_mode]
+                    title, title_color = "HARD MODE", "red"
+            else:
+                title, title_color = "HALL OF FAME", "cyan"
+            if STDOUT_IS_TTY:
+                title = figlet_text(title, "small")
+            lines.append(colored(title, title_color, attrs=["bold"]))
+    
+            # Load all scores from the high scores file
+            scores = self.load_scores()
+            n_total = len(scores)
+        
+            # Aggregate [count, total, best] per mode in a single pass; every
+            # statistic and filter option below is derived from this table
+            mode_stats = collections.defaultdict(lambda: [0, 0, float('-inf')])
+            for score in scores:
+                points = score["score"]
+                stats = mode_stats[score["mode"]]
+                stats[0] += 1
+                stats[1] += points
+                if points > stats[2]:
+                    stats[2] = points
+        
+            # Classify each distinct mode once: the category name of custom modes
+            # and the label shown in the table's CATEGORY column
+            custom_category = {}
+            row_labels = {}
+            for mode in mode_stats:
+                prefix, separator, category = mode.partition(":")
+                if prefix == "Custom" and separator:
+                    custom_category[mode] = category
+                    label = f"🎲 Custom ({category})"
+                elif mode == "Normal":
+                    label = "🟢 Normal"
+                else:  # Hard
+                    label = "🔴 Hard"
+            
+                # Truncate if too long
+                row_labels[mode] = label[:20] + "..." if len(label) > 23 else label
+    
+            # Initialize sorted_scores as an empty list by default; ranked_count is
+            # the number of entries in the current view (sorted_scores may be only
+            # the top of it)
+            sorted_scores = []
+            ranked_count = 0
+    
+            if not scores:
+                # No scores available
+                lines.append(colored("\n" + self._BORDER_60, "yellow"))
+                lines.append(colored("📜 LEADERBOARD EMPTY 📜", "yellow", attrs=["bold", "blink"]))
+                lines.append(colored(self._BORDER_60, "yellow"))
+                lines.append(colored("\nNo champion has claimed their place in history yet!", "white"))
+                lines.append(colored("Be the first to set a high score and immortalize your name!", "white"))
+            else:
+                # Filter scores if a mode is specified
+                if filter_mode:
+                    # For custom categories, we need partial matching
+                    if filter_mode.startswith("Custom:"):
+                        matching_modes = {mode for mode in mode_stats if mode.startswith(filter_mode)}
+                    else:
+                        matching_modes = {filter_mode}
+                    
+                    # The per-mode aggregates already know how many entries match
+                    ranked_count = sum(mode_stats[mode][0] for mode in matching_modes if mode in mode_stats)
+                    if not ranked_count:
+                        lines.append(colored(f"\nNo scores found for {filter_mode} mode!", "yellow"))
+                        lines.append(colored("Try playing a game in this mode to be the first champion!", "white"))
                 
-                if not filtered_scores:
-                    cprint(f"\nNo scores found for {filter_mode} mode!", "yellow")
-                    cprint("Try playing a game in this mode to be the first champion!", "white")
+                        # Navigation options
+                        lines.append(colored("\n" + self._BORDER_75, "cyan"))
+                        lines.append(colored("OPTIONS:", "cyan", attrs=["bold"]))
+                        lines.append(colored("1. Return to Main Menu", "white"))
+                        lines.append(colored("2. View All Scores", "white"))
+                        lines.append(colored(self._BORDER_75, "cyan"))
                 
-                    # Navigation options
-                    cprint("\n" + "═" * 75, "cyan")
-                    cprint("OPTIONS:", "cyan", attrs=["bold"])
-                    cprint("1. Return to Main Menu", "white")
-                    cprint("2. View All Scores", "white")
-                    cprint("═" * 75, "cyan")
+                        self.write_lines(lines)
+                        choice = input("\nEnter your choice (1-2): ").strip()
+                        if choice == "2":
+                            # Show all scores
+                            filter_mode, show_all = None, False
+                            continue
+                        else:
+                            return  # Return to main menu
+                else:
+                    matching_modes = None
+                    ranked_count = n_total
                 
-                    choice = input("\nEnter your choice (1-2): ").strip()
-                    if choice == "2":
-                        return self.display_leaderboard()  # Show all scores
+                # Only the full view sorts; the top players view reads the index
+                # of best scores that is kept up to date as scores are saved
+                if show_all:
+                    if matching_modes is None:
+                        ranked_scores = scores
                     else:
-                        return  # Return to main menu
-            
-                sorted_scores = sorted(filtered_scores, key=lambda x: x["score"], reverse=True)
-            else:
-                # Sort scores in descending order
-                sorted_scores = sorted(scores, key=lambda x: x["score"], reverse=True)
+                        ranked_scores = [s for s in scores if s["mode"] in matching_modes]
+                    sorted_scores = sorted(ranked_scores, key=SCORE_KEY, reverse=True)
+                else:
+                    sorted_scores = self.top_scores(matching_modes)
         
-            # Calculate statistics
-            if filter_mode:
-                if filter_mode.startswith("Custom:"):
-                    relevant_scores = [s for s in scores if s["mode"].startswith(filter_mode)]
+                # Calculate statistics from the per-mode aggregates
+                if filter_mode:
+                    relevant_stats = [mode_stats[mode] for mode in matching_modes if mode in mode_stats]
+                
+                    record_count = sum(st[0] for st in relevant_stats)
+                    if record_count:
+                        avg_score = sum(st[1] for st in relevant_stats) / record_count
+                        highest_score = max(st[2] for st in relevant_stats)
+                    else:
+                        avg_score = 0
+                        highest_score = 0
                 else:
-                    relevant_scores = [s for s in scores if s["mode"] == filter_mode]
+                    record_count = n_total
+                    avg_score = sum(st[1] for st in mode_stats.values()) / record_count
+                    highest_score = sorted_scores[0]["score"] if sorted_scores else 0
+        
+                # Display leaderboard header with stats
+                lines.append(colored("\n" + self._BORDER_75, "yellow"))
+                if filter_mode:
+                    display_mode = filter_mode.split(":")[1] if filter_mode.startswith("Custom:") else filter_mode
+                    lines.append(colored(f"📊 {display_mode.upper()} MODE: {record_count} RECORDS | 🏆 HIGHEST: {highest_score} | 📈 AVERAGE: {avg_score:.1f}", "white"))
+                else:
+                    lines.append(colored(f"📊 TOTAL RECORDS: {n_total} | 🏆 HIGHEST SCORE: {highest_score} | 📈 AVERAGE: {avg_score:.1f}", "white"))
+                lines.append(colored(self._BORDER_75, "yellow"))
+        
+                # Display top player special highlight
+                if ranked_count:
+                    champion = sorted_scores[0]
+                    # Format mode name for display
+                    display_mode = champion['mode']
+                    if display_mode in custom_category:
+                        display_mode = f"Custom ({custom_category[display_mode]})"
                 
-                if relevant_scores:
-                    avg_score = sum(entry["score"] for entry in relevant_scores) / len(relevant_scores)
-                    highest_score = max(entry["score"] for entry in relevant_scores)
+                    lines.append(colored(f"\n👑 REIGNING CHAMPION: {champion['name']} - {champion['score']} points ({display_mode} mode)", 
+                                         "yellow", attrs=["bold"]))
+        
+                # Main leaderboard table
+                if show_all:
+                    lines.append(colored("\n🏅 ALL-TIME CHAMPIONS 🏅", "green", attrs=["bold"]))
                 else:
-                    avg_score = 0
-                    highest_score = 0
-            else:
-                avg_score = sum(entry["score"] for entry in scores) / len(scores)
-                highest_score = sorted_scores[0]["score"] if sorted_scores else 0
+                    lines.append(colored("\n🏅 TOP PLAYERS 🏅", "green", attrs=["bold"]))
         
-            # Group by different categories for statistics
-            easy_scores = [s for s in scores if s["mode"] == "Normal"]
-            hard_scores = [s for s in scores if s["mode"] == "Hard"]
+                lines.append(self._TABLE_TOP)
+                lines.append(self._TABLE_HEADER)
+                lines.append(self._TABLE_SEP)
         
-            # Group custom scores by category
-            custom_scores = {}
-            for score in scores:
-                if score["mode"].startswith("Custom:"):
-                    category = score["mode"].split(":")[1]
-                    if category not in custom_scores:
-                        custom_scores[category] = []
-                    custom_scores[category].append(score)
-        
-            # Display leaderboard header with stats
-            cprint("\n" + "═" * 75, "yellow")
-            if filter_mode:
-                display_mode = filter_mode.split(":")[1] if filter_mode.startswith("Custom:") else filter_mode
-                cprint(f"📊 {display_mode.upper()} MODE: {len(relevant_scores)} RECORDS | 🏆 HIGHEST: {highest_score} | 📈 AVERAGE: {avg_score:.1f}", "white")
-            else:
-                cprint(f"📊 TOTAL RECORDS: {len(scores)} | 🏆 HIGHEST SCORE: {highest_score} | 📈 AVERAGE: {avg_score:.1f}", "white")
-            cprint("═" * 75, "yellow")
-        
-            # Display top player special highlight
-            if len(sorted_scores) > 0:
-                champion = sorted_scores[0]
-                # Format mode name for display
-                display_mode = champion['mode']
-                if display_mode.startswith("Custom:"):
-                    display_mode = f"Custom ({display_mode.split(':')[1]})"
-                
-                cprint(f"\n👑 REIGNING CHAMPION: {champion['name']} - {champion['score']} points ({display_mode} mode)", 
-                       "yellow", attrs=["bold"])
+                # Determine how many scores to display
+                display_count = ranked_count if show_all else min(LEADERBOARD_TOP_COUNT, ranked_count)
         
-            # Main leaderboard table
-            if show_all:
-                cprint("\n🏅 ALL-TIME CHAMPIONS 🏅", "green", attrs=["bold"])
-            else:
-                cprint("\n🏅 TOP PLAYERS 🏅", "green", attrs=["bold"])
-        
-            cprint("┌" + "─" * 5 + "┬" + "─" * 20 + "┬" + "─" * 12 + "┬" + "─" * 25 + "┐", "white")
-            cprint("│ RANK│ PLAYER NAME        │ SCORE      │ CATEGORY                │", "white", attrs=["bold"])
-            cprint("├" + "─" * 5 + "┼" + "─" * 20 + "┼" + "─" * 12 + "┼" + "─" * 25 + "┤", "white")
-        
-            # Determine how many scores to display
-            display_count = len(sorted_scores) if show_all else min(10, len(sorted_scores))
-        
-            # Display scores with rank, name, score, and mode
-            for idx, entry in enumerate(sorted_scores[:display_count], start=1):
-                # Determine row color based on rank
-                if idx == 1:
-                    row_color = "yellow"  # Gold for 1st place
-                elif idx == 2:
-                    row_color = "cyan"    # Silver for 2nd place
-                elif idx == 3:
-                    row_color = "red"     # Bronze for 3rd place
-                else:
-                    row_color = "white"   # Regular color for other ranks
+                # Display scores with rank, name, score, and mode
+                for idx, entry in enumerate(itertools.islice(sorted_scores, display_count), start=1):
+                    # Row color and medal for the top 3, plain white rank otherwise
+                    row_color, rank_display = self._RANK_STYLE.get(idx, self._DEFAULT_RANK_STYLE)
+                    if rank_display is None:
+                        rank_display = f" {idx} "
             
-                # Add medal emoji for top 3
-                rank_display = f" {idx} "
-                if idx == 1:
-                    rank_display = " 1🥇"
-                elif idx == 2:
-                    rank_display = " 2🥈"
-                elif idx == 3:
-                    rank_display = " 3🥉"
+                    # Format the row with proper spacing
+                    name_display = entry['name'][:17] + "..." if len(entry['name']) > 17 else entry['name'].ljust(17)
+                    score_display = f"{entry['score']} pts"
             
-                # Format the row with proper spacing
-                name_display = entry['name'][:17] + "..." if len(entry['name']) > 17 else entry['name'].ljust(17)
-                score_display = f"{entry['score']} pts"
+                    # Mode label was formatted once per distinct mode above
+                    mode_display = row_labels[entry['mode']]
             
-                # Format mode display based on mode type
-                mode = entry['mode']
-                if mode.startswith("Custom:"):
-                    category_name = mode.split(":")[1]
-                    mode_display = f"🎲 Custom ({category_name})"
-                elif mode == "Normal":
-                    mode_display = "🟢 Normal"
-                else:  # Hard
-                    mode_display = "🔴 Hard"
+                    # Print the formatted row
+                    lines.append(colored(f"│{rank_display} │ {name_display}  │ {score_display.ljust(10)} │ {mode_display.ljust(23)}│", 
+                                         row_color))
+        
+                # Show a message if there are more scores not displayed
+                if not show_all and ranked_count > LEADERBOARD_TOP_COUNT:
+                    lines.append(self._TABLE_SEP)
+                    lines.append(colored(f"│     │ ... and {ranked_count - LEADERBOARD_TOP_COUNT} more players ...                              │", "white"))
+        
+                lines.append(self._TABLE_BOTTOM)
+        
+                # Display mode-specific statistics (only on main view, so the
+                # per-category [count, total, best] lookups happen only here)
+                if not filter_mode:
+                    easy_stats = mode_stats.get("Normal")
+                    hard_stats = mode_stats.get("Hard")
+                    custom_stats = {custom_category[mode]: st for mode, st in mode_stats.items() if mode in custom_category}
+                    
+                    # Standard modes
+                    if easy_stats:
+                        easy_count, easy_total, easy_best = easy_stats
+                        lines.append(colored(f"\n🟢 Normal Mode Stats: Avg: {easy_total / easy_count:.1f} | Best: {easy_best} | Players: {easy_count}", "green"))
             
-                # Truncate if too long
-                if len(mode_display) > 23:
-                    mode_display = mode_display[:20] + "..."
+                    if hard_stats:
+                        hard_count, hard_total, hard_best = hard_stats
+                        lines.append(colored(f"🔴 Hard Mode Stats: Avg: {hard_total / hard_count:.1f} | Best: {hard_best} | Players: {hard_count}", "red"))
             
-                # Print the formatted row
-                cprint(f"│{rank_display} │ {name_display}  │ {score_display.ljust(10)} │ {mode_display.ljust(23)}│", 
-                       row_color)
-        
-            # Show a message if there are more scores not displayed
-            if not show_all and len(sorted_scores) > 10:
-                cprint("├" + "─" * 5 + "┼" + "─" * 20 + "┼" + "─" * 12 + "┼" + "─" * 25 + "┤", "white")
-                cprint(f"│     │ ... and {len(sorted_scores) - 10} more players ...                              │", "white")
-        
-            cprint("└" + "─" * 5 + "┴" + "─" * 20 + "┴" + "─" * 12 + "┴" + "─" * 25 + "┘", "white")
-        
-            # Display mode-specific statistics (only on main view)
-            if not filter_mode:
-                # Standard modes
-                if easy_scores:
-                    easy_avg = sum(entry["score"] for entry in easy_scores) / len(easy_scores)
-                    easy_best = max(entry["score"] for entry in easy_scores)
-                    cprint(f"\n🟢 Normal Mode Stats: Avg: {easy_avg:.1f} | Best: {easy_best} | Players: {len(easy_scores)}", "green")
+                    # Add custom category stats
+                    for category, (cat_count, cat_total, cat_best) in custom_stats.items():
+                        lines.append(colored(f"🎲 Custom ({category}) Stats: Avg: {cat_total / cat_count:.1f} | Best: {cat_best} | Players: {cat_count}", "cyan"))
+    
+            # Create filter options based on the modes present in the aggregates
+            # (empty when there are no scores): standard modes, then custom categories
+            filter_options = [(mode, color) for mode, color in (("Normal", "green"), ("Hard", "red"))
+                              if mode in mode_stats]
+            filter_options += [(f"Custom:{category}", "cyan") for category in sorted(set(custom_category.values()))]
+    
+            # Navigation options - always displayed regardless of empty scores
+            lines.append(colored("\n" + self._BORDER_75, "cyan"))
+            lines.append(colored("OPTIONS:", "cyan", attrs=["bold"]))
+            lines.append(colored("1. Return to Main Menu", "white"))
+    
+            # Only show these options if there are scores to display; each is
+            # (label, color, view it switches to as (filter_mode, show_all))
+            options = []
+            if ranked_count:
+                if not show_all and ranked_count > LEADERBOARD_TOP_COUNT:
+                    options.append(("View All-Time Hall of Fame", "white", (filter_mode, True)))
+                elif show_all:
+                    options.append(("View Top 10 Only", "white", (filter_mode, False)))
+                
+                if not filter_mode:
+                    # Display filter options based on available data
+                    for mode, color in filter_options:
+                        if mode.startswith("Custom:"):
+                            display_text = f"Filter by Custom: {mode.split(':')[1]}"
+                        else:
+                            display_text = f"Filter by {mode} Mode"
+                        options.append((display_text, color, (mode, show_all)))
+                else:
+                    options.append(("Show All Categories", "white", (None, show_all)))
             
-                if hard_scores:
-                    hard_avg = sum(entry["score"] for entry in hard_scores) / len(hard_scores)
-                    hard_best = max(entry["score"] for entry in hard_scores)
-                    cprint(f"🔴 Hard Mode Stats: Avg: {hard_avg:.1f} | Best: {hard_best} | Players: {len(hard_scores)}", "red")
+            # Number the options and remember which view each number selects
+            actions = {}
+            for option_num, (label, color, view) in enumerate(options, start=2):
+                lines.append(colored(f"{option_num}. {label}", color))
+                actions[str(option_num)] = view
             
-                # Add custom category stats
-                for category, cat_scores in custom_scores.items():
-                    if cat_scores:
-                        cat_avg = sum(entry["score"] for entry in cat_scores) / len(cat_scores)
-                        cat_best = max(entry["score"] for entry in cat_scores)
-                        cprint(f"🎲 Custom ({category}) Stats: Avg: {cat_avg:.1f} | Best: {cat_best} | Players: {len(cat_scores)}", "cyan")
-    
-        # Create filter options based on available modes
-        filter_options = []
-        if scores:
-            modes = set()
-            custom_categories = set()
-        
-            # Collect all available modes
-            for score in scores:
-                mode = score["mode"]
-                if mode.startswith("Custom:"):
-                    custom_categories.add(mode.split(":")[1])
-                else:
-                    modes.add(mode)
-        
-            # Add standard modes
-            if "Normal" in modes:
-                filter_options.append(("Normal", "green"))
-            if "Hard" in modes:
-                filter_options.append(("Hard", "red"))
-        
-            # Add custom categories
-            for category in sorted(custom_categories):
-                filter_options.append((f"Custom:{category}", "cyan"))
-    
-        # Navigation options - always displayed regardless of empty scores
-        cprint("\n" + "═" * 75, "cyan")
-        cprint("OPTIONS:", "cyan", attrs=["bold"])
-        cprint("1. Return to Main Menu", "white")
-    
-        # Only show these options if there are scores to display
-        option_num = 2
-        if len(sorted_scores) > 0:
-            if not show_all and len(sorted_scores) > 10:
-                cprint(f"{option_num}. View All-Time Hall of Fame", "white")
-                option_num += 1
-            elif show_all:
-                cprint(f"{option_num}. View Top 10 Only", "white")
-                option_num += 1
-        
-            if not filter_mode:
-                # Display filter options based on available data
-                for i, (mode, color) in enumerate(filter_options, start=option_num):
-                    display_text = mode
-                    if mode.startswith("Custom:"):
-                        display_text = f"Filter by Custom: {mode.split(':')[1]}"
-                    else:
-                        display_text = f"Filter by {mode} Mode"
-                    
-                    cprint(f"{i}. {display_text}", color)
-                option_num = option_num + len(filter_options)
-            else:
-                cprint(f"{option_num}. Show All Categories", "white")
-                option_num += 1
-    
-        cprint("═" * 75, "cyan")
+            lines.append(colored(self._BORDER_75, "cyan"))
     
-        # Handle user selection
-        try:
-            choice = input("\nEnter your choice: ").strip()
+            self.write_lines(lines)
         
-            # Process choice
-            if choice == "1":
-                # Return to main menu
+            # Handle user selection
+            try:
+                choice = input("\nEnter your choice: ").strip()
+        
+                # Process choice
+                if choice == "1":
+                    # Return to main menu
+                    self.clear_screen()
+                    return
+            
+                # Every other listed option updates the view settings and
+                # redraws the board
+                view = actions.get(choice)
+                if view is not None:
+                    filter_mode, show_all = view
+                    continue
+            except Exception as e:
+                cprint(f"\nAn error occurred: {e}", "red")
+                time.sleep(2)
                 self.clear_screen()
                 return
-            
-            # Only process other options if there are scores
-            if len(sorted_scores) > 0:
-                if choice == "2":
-                    if not show_all and len(sorted_scores) > 10:
-                        # Toggle between all scores and top 10
-                        self.display_leaderboard(filter_mode, not show_all)
-                    elif show_all:
-                        # Toggle back to top 10
-                        self.display_leaderboard(filter_mode, False)
-                    elif filter_mode:
-                        # Show all categories
-                        self.display_leaderboard(None, show_all)
-                    elif len(filter_options) > 0:
-                        # Apply first filter
-                        self.display_leaderboard(filter_options[0][0], show_all)
-                elif not filter_mode:
-                    # Check if it's a filter option
-                    choice_idx = int(choice) - option_num + len(filter_options)
-                    if 0 <= choice_idx < len(filter_options):
-                        filter_mode = filter_options[choice_idx][0]
-                        self.display_leaderboard(filter_mode, show_all)
-                elif choice == "3" and filter_mode:
-                    # Show all categories
-                    self.display_leaderboard(None, show_all)
-        except Exception as e:
-            cprint(f"\nAn error occurred: {e}", "red")
-            time.sleep(2)
-            self.clear_screen()
+        
+            # Anything else isn't one of the listed options
+            cprint("\n❌ Invalid choice. Please select one of the listed options.", "red")
+            time.sleep(1)
     
-    def check_game_status(self, hidden_word, word_to_guess, attempts_left, wrong_guesses, one_time_guess=False):
+    def check_game_status(self, letters_remaining, word_to_guess, attempts_left, wrong_guesses, one_time_guess=False):
         """
         Check if the game has been won or lost and display appropriate screen.
         
+        The word counts as guessed once no letters remain hidden, so the
+        check costs no string comparison per turn.
+        
         Args:
-            hidden_word (str): Current state of the word with some letters hidden
+            letters_remaining (int): Number of distinct letters still hidden
             word_to_guess (str): The complete word to guess
             attempts_left (int): Number of remaining incorrect guesses allowed
             wrong_guesses (int): Count of incorrect guesses
@@ -1083,7 +1553,7 @@ class HangmanGame:
         Returns:
             str: Game status ("win", "lose", or "continue")
         """
-        if hidden_word == word_to_guess:
+        if not letters_remaining:
             # VICTORY SCREEN
             self.clear_screen()
             self.sfx_win()
@@ -1101,23 +1571,21 @@ class HangmanGame:
                 /___________\
             """
             
-            # Simulate confetti animation
-            for _ in range(3):
-                self.clear_screen()
-                cprint(victory_art.replace("{{1}}", "\\o/"), "green")
-                cprint("\n" + "🎊 " * 20, "yellow")
-                time.sleep(0.3)
-                
+            # Simulate confetti animation (both frames rendered once, then alternated)
+            confetti_frames = (
+                colored(victory_art.replace("{{1}}", "\\o/"), "green") + "\n" + colored("\n" + "🎊 " * 20, "yellow"),
+                colored(victory_art.replace("{{1}}", " o "), "green") + "\n" + colored("\n" + " 🎉 " * 20, "cyan"),
+            )
+            for frame in confetti_frames * (3 if STDOUT_IS_TTY else 0):
                 self.clear_screen()
-                cprint(victory_art.replace("{{1}}", " o "), "green")
-                cprint("\n" + " 🎉 " * 20, "cyan")
+                print(frame)
                 time.sleep(0.3)
             
             # Final victory screen
             self.clear_screen()
             
             # Trophy and confetti
-            cprint(figlet_format("VICTORY!", font="stop"), "yellow", attrs=["bold"])
+            cprint(figlet_text("VICTORY!", "stop"), "yellow", attrs=["bold"])
             
             border = "★" * 70
             cprint(border, "yellow")
@@ -1144,19 +1612,19 @@ class HangmanGame:
             # Display full hangman figure
             print(self.HANGMANPICS[wrong_guesses])
             
-            # Game over title with flickering effect
-            for _ in range(3):
+            # Game over title with flickering effect (both colors rendered once)
+            game_over_art = figlet_text("GAME OVER", "doom")
+            game_over_red = colored(game_over_art, "red", attrs=["bold"])
+            game_over_grey = colored(game_over_art, "dark_grey", attrs=["bold"])
+            for frame in (game_over_red, game_over_grey) * (3 if STDOUT_IS_TTY else 0):
                 self.clear_screen()
-                cprint(figlet_format("GAME OVER", font="doom"), "red", attrs=["bold"])
-                time.sleep(0.3)
-                self.clear_screen()
-                cprint(figlet_format("GAME OVER", font="doom"), "dark_grey", attrs=["bold"])
+                print(frame)
                 time.sleep(0.3)
             
             self.clear_screen()
             
             # Dramatic defeat display
-            cprint(figlet_format("GAME OVER", font="doom"), "red", attrs=["bold"])
+            print(game_over_red)
             
             # Hangman with red color for impact
             cprint(self.HANGMANPICS[6], "red")
@@ -1191,13 +1659,13 @@ class HangmanGame:
         Present an enhanced difficulty selection menu with custom play option.
         
         Returns:
-            list: The appropriate word list based on player's choice
+            tuple: The appropriate word list based on player's choice
         """
         while True:
             self.clear_screen()
         
             # Title with decorative border
-            border = "=" * 60
+            border = self._MENU_BORDER
             cprint(border, "yellow")
             cprint("🎯  DIFFICULTY SELECTION  🎯", "yellow", attrs=["bold"])
             cprint(border, "yellow")
@@ -1207,26 +1675,26 @@ class HangmanGame:
             cprint("Choose wisely, brave wordsmith...", "white")
         
             # Option boxes with visual elements
-            cprint("\n┌" + "─" * 56 + "┐", "green")
+            cprint("\n" + self._BOX_TOP, "green")
             cprint("│  1. 🟢 Normal MODE                                     │", "green")
             cprint("│     • Common, everyday words                           │", "green")
             cprint("│     • More forgiving gameplay +3 Hints                 │", "green")
             cprint("│     • Perfect for casual players or beginners          │", "green")
-            cprint("└" + "─" * 56 + "┘", "green")
+            cprint(self._BOX_BOTTOM, "green")
         
-            cprint("\n┌" + "─" * 56 + "┐", "red")
+            cprint("\n" + self._BOX_TOP, "red")
             cprint("│  2. 🔴 HARD MODE                                       │", "red")
             cprint("│     • Uncommon and challenging words                   │", "red")
             cprint("│     • Test your vocabulary limits                      │", "red")
             cprint("│     • For experienced players seeking a challenge      │", "red")
-            cprint("└" + "─" * 56 + "┘", "red")
+            cprint(self._BOX_BOTTOM, "red")
         
-            cprint("\n┌" + "─" * 56 + "┐", "cyan")
+            cprint("\n" + self._BOX_TOP, "cyan")
             cprint("│  3. 🎲 CUSTOM PLAY                                     │", "cyan")
             cprint("│     • Choose specific word categories                  │", "cyan")
             cprint("│     • Adjust difficulty to your preferences            │", "cyan")
             cprint("│     • Specialized gameplay experience                  │", "cyan")
-            cprint("└" + "─" * 56 + "┘", "cyan")
+            cprint(self._BOX_BOTTOM, "cyan")
         
             # Prompt for input with custom styling
             cprint("\n" + border, "yellow")
@@ -1265,7 +1733,7 @@ class HangmanGame:
         Allows players to choose from different word categories.
         
         Returns:
-            list: The selected word list based on category
+            tuple: The selected word list based on category
         """
         # Define available categories with their icons and file names
         categories = {
@@ -1279,7 +1747,7 @@ class HangmanGame:
             self.clear_screen()
         
             # Title section
-            cprint(figlet_format("CATEGORY", font="small"), "cyan", attrs=["bold"])
+            cprint(figlet_text("CATEGORY", "small"), "cyan", attrs=["bold"])
             cprint("Select a category of words to play with:", "white")
         
             # Display each category with custom styling
@@ -1289,7 +1757,7 @@ class HangmanGame:
             
                 # Show stats about this category if available
                 try:
-                    word_count = len(self.load_word_list(category["file"]))
+                    word_count = len(self.word_lists[category["file"]])
                     cprint(f"    • {word_count} words available", category_color)
                 
                     # Calculate and display difficulty rating
@@ -1301,7 +1769,7 @@ class HangmanGame:
                     cprint(f"    • File not loaded", "red")
         
             # Bottom border
-            cprint("\n" + "=" * 60, "cyan")
+            cprint("\n" + self._MENU_BORDER, "cyan")
         
             # Prompt for selection
             choice = input("\nEnter your category choice (1-4) or 'b' to go back: ").strip().lower()
@@ -1314,7 +1782,7 @@ class HangmanGame:
             if choice in categories:
                 selected = categories[choice]
                 try:
-                    word_list = self.load_word_list(selected["file"])
+                    word_list = self.word_lists[selected["file"]]
                     if not word_list:
                         cprint(f"\nError: No words found in {selected['name']} category!", "red")
                         time.sleep(1.5)
@@ -1336,31 +1804,25 @@ class HangmanGame:
     # Game Logic Methods
     #-------------------------------------------------------------------------
     
-    def update_hidden_word(self, word_to_guess, hidden_word, guessed_letter):
+    def update_hidden_word(self, word_to_guess, hide_table, guessed_letter):
         """
         Reveals all occurrences of a correctly guessed letter in the hidden word.
+        
+        The letter is removed from hide_table in place, so the round's table
+        keeps track of what is still hidden.
     
         Args:
             word_to_guess (str): The complete word to guess
-            hidden_word (str): Current state of the word with some letters revealed
+            hide_table (dict): The round's str.translate table of still-hidden characters
             guessed_letter (str): The letter that was guessed
     
         Returns:
             str: Updated hidden word with all instances of the guessed letter revealed
         """
-        # Create a new string to store the updated hidden word
-        new_hidden_word = ""
-    
-        # Replace all occurrences of the guessed letter in the hidden word
-        for i in range(len(word_to_guess)):
-            if word_to_guess[i] == guessed_letter:
-                # Reveal this occurrence of the letter
-                new_hidden_word += guessed_letter
-            else:
-                # Keep the current state of this position (revealed or hidden)
-                new_hidden_word += hidden_word[i]
-    
-        return new_hidden_word
+        # Stop hiding the letter, then let str.translate mask whatever is
+        # still hidden in a single pass over the word
+        hide_table.pop(ord(guessed_letter), None)
+        return word_to_guess.translate(hide_table)
     
     def get_hint(self, word_to_guess, hidden_word):
         """
@@ -1377,24 +1839,18 @@ class HangmanGame:
                   hinted letter revealed in all positions, and the letter that was revealed
         """
         if self.hints <= 0:
-            cprint("No hints left!", "red")
+            print(self._msg["no_hints"])
             return hidden_word, None
     
-        # Find all letter positions that are still hidden
-        hidden_positions = [i for i, char in enumerate(hidden_word) if char == "-"]
-
-        if not hidden_positions:
-            cprint("All letters are already revealed!", "yellow")
+        if not self._hide_table:
+            print(self._msg["all_revealed"])
             return hidden_word, None
     
-        # Choose a random position to reveal
-        position = random.choice(hidden_positions)
-
-        # Get the letter at that position
-        hint_letter = word_to_guess[position]
+        # Choose a random letter that is still hidden
+        hint_letter = chr(random.choice(tuple(self._hide_table)))
 
         # Reveal all occurrences of this letter
-        new_hidden_word = self.update_hidden_word(word_to_guess, hidden_word, hint_letter)
+        new_hidden_word = self.update_hidden_word(word_to_guess, self._hide_table, hint_letter)
 
         self.sfx_hint()
         cprint(f"Hint used! Letter '{hint_letter}' revealed.", "cyan")
@@ -1402,6 +1858,43 @@ class HangmanGame:
 
         return new_hidden_word, hint_letter
     
+    def _prompt_and_save_score(self):
+        """
+        Ask for the player's name and save the current global score.
+        
+        The name used last time is offered as the default, so pressing
+        Enter saves under it again. Callers print the confirmation, so
+        each keeps its own spacing.
+        
+        Returns:
+            bool: True if a score was saved, False if there was nothing to save
+        """
+        if self.global_score <= 0:
+            return False
+        
+        if self._last_name:
+            player_name = input(f"Enter your name to save your score [{self._last_name}]: ") or self._last_name
+        else:
+            player_name = input("Enter your name to save your score: ")
+        self._last_name = player_name
+        
+        self.save_score(player_name, self.global_score)
+        return True
+    
+    def _apply_level_win(self, bonus=0):
+        """
+        Bank the level score and advance to the next level after a win.
+        
+        Completing a level also earns one extra hint.
+        
+        Args:
+            bonus (int, optional): Points added to the level score first
+        """
+        self.level_score += bonus
+        self.global_score += self.level_score
+        self.level += 1
+        self.hints += 1
+    
     def play_game(self):
         """
         Main game loop that handles player input and game progression.
@@ -1428,14 +1921,22 @@ class HangmanGame:
             # Pick a random word
             word_to_guess = random.choice(word_list).lower()
             hidden_word = "-" * len(word_to_guess)
-            guessed_letters = set()
+            guessed_mask = 0
+            
+            # Every character starts hidden; reveals and hints remove theirs
+            self._hide_table = dict.fromkeys(map(ord, word_to_guess), "-")
+            
+            # Letters of the word as a bitmask, so checking a guess is a single AND
+            word_mask = 0
+            for letter in set(word_to_guess):
+                word_mask |= LETTER_BITS.get(letter, 0)
             attempts_left = 6
             wrong_guesses = 0
             
             # Main game loop for the current round
             while True:
                 # Display current game state
-                self.display_game_state(hidden_word, attempts_left, guessed_letters, wrong_guesses)
+                self.display_game_state(hidden_word, attempts_left, guessed_mask, wrong_guesses)
                 
                 # Get player input
                 player_guess = input("Enter a letter, the full word, or type 'hint': ").lower()
@@ -1444,11 +1945,9 @@ class HangmanGame:
                 if player_guess == "stp":
                     self.clear_screen()
                     print("")
-                    if self.global_score > 0:
-                        player_name = input("Enter your name to save your score: ")
-                        self.save_score_pickle(player_name, self.global_score)
+                    if self._prompt_and_save_score():
                         print("")
-                        cprint("Your score has been saved!", "green", attrs=["bold"])
+                        print(self._msg["score_saved"])
                         print("")
                     self.clear_screen()
                     self.display_game_rules()
@@ -1463,54 +1962,54 @@ class HangmanGame:
 
                         # Check if hint was actually used (hint count would have been decremented)
                         if hidden_word != old_hidden_word and revealed_letter:
-                            # Add the revealed letter to guessed_letters so it shows up in the alphabet panel
-                            guessed_letters.add(revealed_letter)
+                            # Mark the revealed letter as guessed so it shows up in the alphabet panel
+                            guessed_mask |= LETTER_BITS.get(revealed_letter, 0)
                             guessed += 1
             
                             # Check if the word is fully revealed after hint
-                            if hidden_word == word_to_guess:
-                                self.level_score += 10  # Add points for the revealed letter
-                                self.global_score += self.level_score
-                                self.level += 1
-                                self.hints += 1  # Add one hint for completing the word
+                            # (nothing left in the round's hide table)
+                            if not self._hide_table:
+                                self._apply_level_win(bonus=10)  # Add points for the revealed letter
         
                                 # Show win screen
-                                self.check_game_status(hidden_word, word_to_guess, attempts_left, wrong_guesses)
-                                time.sleep(2)
+                                self.check_game_status(len(self._hide_table), word_to_guess, attempts_left, wrong_guesses)
+                                self.sound_manager.wait_until_idle(timeout=2)
                                 break  # Exit to next level
                     else:
-                        cprint("No hints left!", "red")
+                        print(self._msg["no_hints"])
                         self.sfx_incorrect()
 
-                    time.sleep(1)
+                    time.sleep(self._feedback_delay)
                     continue          
                 
-                # Validate input for a single letter guess
-                if len(player_guess) == 1 and player_guess.isalpha():
-                    if player_guess in guessed_letters:
-                        cprint("You already guessed that letter. Try again!", "red")
-                        time.sleep(1)
+                # Validate input for a single letter guess (a-z, see LETTER_BITS)
+                letter_bit = LETTER_BITS.get(player_guess)
+                if letter_bit:
+                    if guessed_mask & letter_bit:
+                        print(self._msg["already_guessed"])
+                        time.sleep(self._feedback_delay)
                         continue  # Ask for input again without penalty
                     
-                    guessed_letters.add(player_guess)
+                    guessed_mask |= letter_bit
                     
-                    if player_guess in word_to_guess:
-                        hidden_word = self.update_hidden_word(word_to_guess, hidden_word, player_guess)
+                    if word_mask & letter_bit:
+                        hidden_word = self.update_hidden_word(word_to_guess, self._hide_table, player_guess)
                         self.sfx_correct()
                         guessed += 1
                         self.level_score += 10  # Add points for correct guess
                     else:
                         self.sfx_incorrect()
-                        cprint("Incorrect guess!", "red")
+                        print(self._msg["incorrect"])
                         wrong_guesses += 1
                         attempts_left -= 1
                         self.level_score = max(0, self.level_score - 5)  # Deduct points, minimum 0
-                        time.sleep(1)
+                        time.sleep(self._feedback_delay)
                 
                 # Allow full word guesses
-                elif len(player_guess) > 1 and player_guess.isalpha():
+                elif WORD_GUESS_RE.fullmatch(player_guess):
                     if player_guess == word_to_guess:
                         hidden_word = word_to_guess
+                        self._hide_table.clear()  # Nothing is hidden any more
                         if guessed <= 1:
                             one_time_guess = True
                             self.level_score += 50  # Bonus for guessing the whole word early
@@ -1519,31 +2018,29 @@ class HangmanGame:
                         self.sfx_correct()
                     else:
                         self.sfx_incorrect()
-                        cprint("Incorrect word guess!", "red")
+                        print(self._msg["incorrect_word"])
                         wrong_guesses += 1
                         attempts_left -= 1
                         self.level_score = max(0, self.level_score - 5)  # Deduct points, minimum 0
-                        time.sleep(1)
+                        time.sleep(self._feedback_delay)
                 else:
-                    cprint("Invalid input. Please guess a single letter, the full word, or type 'hint'.", "red")
-                    time.sleep(1)
+                    print(self._msg["invalid"])
+                    time.sleep(self._feedback_delay)
                     continue
                 
                 # Check game status after each guess
-                status = self.check_game_status(hidden_word, word_to_guess, attempts_left, wrong_guesses, one_time_guess)
+                status = self.check_game_status(len(self._hide_table), word_to_guess, attempts_left, wrong_guesses, one_time_guess)
                 
                 if status in ("win", "lose"):
                     if status == "win":
                         print("")
                         if one_time_guess:
-                            cprint("You got +50 Bonus 🎁", 'light_yellow')
+                            print(self._msg["bonus"])
                         print("")
-                        self.global_score += self.level_score
+                        self._apply_level_win()
                         cprint(f"Your score in this level: {self.level_score}", "white", attrs=["bold"])
                         print("")
                         cprint(f"Your Total Score: {self.global_score}", "yellow", attrs=["bold"])
-                        self.level += 1
-                        self.hints += 1  # Add hint for winning
                         time.sleep(2)
                         break  # Move to next level
                         
@@ -1552,28 +2049,21 @@ class HangmanGame:
                         self.level = 0  # Reset level
                         print("")
                         
-                        if self.global_score > 0:
-                            player_name = input("Enter your name to save your score: ")
-                            self.save_score_pickle(player_name, self.global_score)
-                            cprint("Your score has been saved!", "green", attrs=["bold"])
+                        if self._prompt_and_save_score():
+                            print(self._msg["score_saved"])
                             time.sleep(1.5)
                             self.clear_screen()
 
-                        cprint("1- Start new game ", "green", attrs=["bold"])
-                        cprint("2- Main-Menu", "yellow", attrs=["bold"])
-                        cprint("3- Exit ", "red", attrs=["bold"])        
-                        cprint("=================================", "white", attrs=["bold"])     
-                        play_again = input("").strip().lower()
-
-                        if play_again == "1":
-                            return "restart"  # new game
-                        elif play_again == "3":
+                        print(self._end_menu_screen)
+                        # A single key press picks the option, no Enter needed
+                        outcome = self._END_MENU.get(read_key(), "main-menu")
+                        
+                        if outcome == "quit":
                             print("")
                             cprint("Thanks for playing! Goodbye!", "red")
-                            return "quit"  # Exit game
-                        else:
+                        elif outcome == "main-menu":
                             cprint("Main-Menu Loading .....", "green")
-                            return "main-menu"  # main-menu 
+                        return outcome
             
             # End of current level, continue to next level
             continue
@@ -1586,22 +2076,29 @@ class HangmanGame:
         """
         Calculate the average word length in a word list file.
         
+        Uses the letter totals counted when the word lists were loaded, so
+        this is a single division for every list read at startup.
+        
         Args:
             filename (str): Name of the word list file
             
         Returns:
             float: Average word length
         """
-        words = self.load_word_list(filename)
-        if not words:
-            return 0
-        return sum(len(word) for word in words) / len(words)
+        words = self.word_lists.get(filename)
+        if words is None:
+            words = self.word_lists[filename] = self.load_word_list(filename)
+            self._letter_counts[filename] = sum(map(len, words))
+        return self._letter_counts[filename] / len(words) if words else 0
 
-    def calculate_difficulty_rating(self, avg_length, word_count):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def calculate_difficulty_rating(avg_length, word_count):
         """
         Calculate a difficulty rating (1-5) based on average word length and count.
         
         Longer words and smaller word pools generally mean higher difficulty.
+        The rating only depends on its arguments, so each result is cached.
         
         Args:
             avg_length (float): Average word length
@@ -1648,10 +2145,15 @@ class HangmanGame:
         
         Initializes game environment and manages the overall game flow.
         """
-        # Initialize high scores file if it doesn't exist
-        if not os.path.exists(get_save_file_path("high_scores.pkl")):
-            with open(get_save_file_path("high_scores.pkl"), "wb") as file:
-                pickle.dump([], file)
+        # Bring over scores saved in the old pickle format
+        self.migrate_legacy_scores()
+        
+        # Initialize high scores file if it doesn't exist ('x' mode refuses to
+        # open an existing file, so no separate existence check is needed)
+        try:
+            open(self._high_scores_path, "x").close()
+        except FileExistsError:
+            pass
                 
         # Show intro screens on first run
         if self.first_time:
@@ -1664,7 +2166,8 @@ class HangmanGame:
         while True:
             result = self.play_game()
             
-            if result == "quit":    
+            if result == "quit":
+                self.flush_scores()  # Make sure the last score is on disk
                 break
             elif result == "restart":
                 self.sound_manager.stop_all()